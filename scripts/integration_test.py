@@ -1,34 +1,62 @@
 #!/usr/bin/env python3
 
+import asyncio
+import collections
 import time
-import signal
 import sys
 import os
+import re
 import subprocess
 import shlex
+import socket
 import threading
 from datetime import datetime
 from pathlib import Path
 
 import toml
 import requests
+from requests.adapters import HTTPAdapter
 import psutil
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
-from jinja2 import Template
+from rich.markup import escape
 
 console = Console()
 
+# Output patterns, compiled once and shared by every call site
+PKG_RE = re.compile(rb"PackageID:\s*(0x[a-fA-F0-9]+)", re.IGNORECASE)
+CREATED_RE = re.compile(r"Created Objects:.*?ObjectID:\s*(0x[a-fA-F0-9]+)", re.DOTALL | re.IGNORECASE)
+OBJECT_ID_RE = re.compile(r"│\s*ObjectID:\s*(0x[a-fA-F0-9]+)", re.IGNORECASE)
+FUZZER_KW_RE = re.compile(rb"iteration|shift|violation|detected|error|failed", re.IGNORECASE)
+ITERATION_RE = re.compile(r"iteration", re.IGNORECASE)
+VIOLATION_RE = re.compile(r"SHIFT VIOLATION DETECTED", re.IGNORECASE)
+LOCALNET_KW_RE = re.compile(r"error|fatal|panic|failed|listening", re.IGNORECASE)
+LISTENING_RE = re.compile(r"listening", re.IGNORECASE)
+
+# Line length limit for asyncio subprocess readers (the default is 64 KiB)
+STREAM_LIMIT = 16 * 1024 * 1024
+
 class IntegrationTester:
     def __init__(self):
         self.script_dir = Path(__file__).parent
         self.root_dir = self.script_dir.parent
         self.sui_binary = self.script_dir / "sui"
+        self.fuzzer_bin = None
         self.localnet_process = None
+        self.localnet_reader = None
+        self.localnet_ready = None
+        self.localnet_tail = None
         self.package_id = None
         self.shared_object_id = None
+        self._active_address = None
         self.test_results = []
+        self.log_lock = threading.Lock()
+
+        # Shared HTTP session so faucet requests reuse pooled connections
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.http.mount("http://", adapter)
 
         # Load test configuration
         config_file = self.script_dir / "test_cases.toml"
@@ -46,25 +74,36 @@ class IntegrationTester:
             "DEBUG": "[cyan]"
         }
         color = colors.get(level, "[white]")
-        console.print(f"{color}[{timestamp}] {message}[/]")
+        with self.log_lock:
+            console.print(f"{color}[{timestamp}] {escape(message)}[/]")
 
-    def run_sui_command(self, *args, cwd=None, timeout=30, ignore_error=False):
-        """Helper to run sui commands using subprocess"""
+    def run_sui_command(self, *args, cwd=None, timeout=30, ignore_error=False, capture=True, text=True):
+        """Helper to run sui commands using subprocess
+
+        With capture=False output is discarded, for callers that only need the
+        return code. With text=False stdout/stderr are returned as raw bytes.
+        """
         cmd = [str(self.sui_binary)] + list(args)
+        output = subprocess.PIPE if capture else subprocess.DEVNULL
         try:
             result = subprocess.run(
                 cmd,
                 cwd=cwd or self.script_dir,
-                capture_output=True,
-                text=True,
+                stdout=output,
+                stderr=output,
+                text=text,
                 timeout=timeout
             )
             if result.returncode != 0 and not ignore_error:
                 self.log(f"Sui command failed: {' '.join(args)}", "ERROR")
-                if result.stderr:
-                    self.log(f"Error: {result.stderr.strip()}", "ERROR")
-                if result.stdout:
-                    self.log(f"Output: {result.stdout.strip()}", "ERROR")
+                stderr, stdout = result.stderr, result.stdout
+                if not text:
+                    stderr = stderr.decode('utf-8', 'replace') if stderr else stderr
+                    stdout = stdout.decode('utf-8', 'replace') if stdout else stdout
+                if stderr:
+                    self.log(f"Error: {stderr.strip()}", "ERROR")
+                if stdout:
+                    self.log(f"Output: {stdout.strip()}", "ERROR")
                 raise Exception(f"Command failed with code {result.returncode}")
             return result
         except subprocess.TimeoutExpired:
@@ -72,47 +111,34 @@ class IntegrationTester:
             raise Exception("Command timed out")
 
     def is_port_open(self, port, timeout=30):
-        """Check if port is open using psutil with fallback to socket"""
+        """Check if port is open by probing it with a socket connection"""
         self.log(f"Checking port {port}...")
-        for i in range(timeout):
-            # Method 1: Try psutil (may have permission issues)
+        attempts = timeout * 10
+        for i in range(attempts):
             try:
-                for conn in psutil.net_connections():
-                    if hasattr(conn, 'laddr') and conn.laddr and conn.laddr.port == port:
-                        self.log(f"Port {port} is open (psutil)", "SUCCESS")
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                    sock.settimeout(0.2)
+                    if sock.connect_ex(('127.0.0.1', port)) == 0:
+                        self.log(f"Port {port} is open", "SUCCESS")
                         return True
-            except (psutil.AccessDenied, psutil.NoSuchProcess) as e:
-                self.log(f"psutil permission issue: {e}", "DEBUG")
-            except Exception as e:
-                self.log(f"psutil error: {e}", "DEBUG")
-
-            # Method 2: Try socket connection (more reliable)
-            try:
-                import socket
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('localhost', port))
-                sock.close()
-                if result == 0:
-                    self.log(f"Port {port} is open (socket)", "SUCCESS")
-                    return True
             except Exception as e:
                 self.log(f"socket error: {e}", "DEBUG")
 
-            if i < timeout - 1:  # Don't sleep on last iteration
-                time.sleep(1)
+            if i < attempts - 1:  # Don't sleep on last iteration
+                time.sleep(0.1)
 
         self.log(f"Port {port} is not open after {timeout}s", "WARNING")
         return False
 
-    def kill_process_on_port(self, port):
-        """Kill any process using the given port"""
+    def kill_processes_on_ports(self, ports):
+        """Kill any process using one of the given ports in a single process scan"""
         for proc in psutil.process_iter(['pid', 'name']):
             try:
-                for conn in proc.net_connections():
-                    if conn.laddr.port == port:
-                        self.log(f"Killing process {proc.info['name']} (PID: {proc.info['pid']}) on port {port}")
+                for conn in proc.net_connections(kind='inet'):
+                    if conn.laddr and conn.laddr.port in ports:
+                        self.log(f"Killing process {proc.info['name']} (PID: {proc.info['pid']}) on port {conn.laddr.port}")
                         proc.kill()
+                        break
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
 
@@ -129,6 +155,14 @@ class IntegrationTester:
                 self.log("Build failed:", "ERROR")
                 return False
 
+            # Invoke the built binary directly so each test skips cargo's freshness checks
+            target_dir = self.root_dir / os.environ.get("CARGO_TARGET_DIR", "target")
+            self.fuzzer_bin = target_dir / "release" / self.config.get("fuzzer_binary", "fuzzer")
+            if not self.fuzzer_bin.exists():
+                # Keep going so the localnet, wallet and deploy steps still run;
+                # each fuzzer test then reports the missing binary as its failure
+                self.log(f"Fuzzer binary not found at {self.fuzzer_bin} (set fuzzer_binary in test_cases.toml)", "WARNING")
+
             self.log("Build completed successfully", "SUCCESS")
             return True
         except subprocess.TimeoutExpired:
@@ -138,41 +172,79 @@ class IntegrationTester:
             self.log(f"Build failed: {e}", "ERROR")
             return False
 
-    def cleanup_localnet_process(self):
+    async def cleanup_localnet_process(self):
         """Force cleanup localnet process to avoid hanging"""
         if self.localnet_process:
             try:
-                self.log("Terminating localnet process...")
-                self.localnet_process.terminate()
+                if self.localnet_process.returncode is None:
+                    self.log("Terminating localnet process...")
+                    self.localnet_process.terminate()
 
-                # Wait for graceful termination
-                try:
-                    self.localnet_process.wait(timeout=3)
-                    self.log("Localnet process terminated gracefully", "SUCCESS")
-                except subprocess.TimeoutExpired:
-                    self.log("Force killing localnet process...")
-                    self.localnet_process.kill()
+                    # Wait for graceful termination
                     try:
-                        self.localnet_process.wait(timeout=2)
-                        self.log("Localnet process killed", "SUCCESS")
-                    except subprocess.TimeoutExpired:
-                        self.log("Process may still be running", "WARNING")
+                        await asyncio.wait_for(self.localnet_process.wait(), timeout=3)
+                        self.log("Localnet process terminated gracefully", "SUCCESS")
+                    except asyncio.TimeoutError:
+                        self.log("Force killing localnet process...")
+                        self.localnet_process.kill()
+                        try:
+                            await asyncio.wait_for(self.localnet_process.wait(), timeout=2)
+                            self.log("Localnet process killed", "SUCCESS")
+                        except asyncio.TimeoutError:
+                            self.log("Process may still be running", "WARNING")
 
             except Exception as e:
                 self.log(f"Error during cleanup: {e}", "DEBUG")
             finally:
                 self.localnet_process = None
 
-    def start_localnet(self):
+        if self.localnet_reader:
+            self.localnet_reader.cancel()
+            self.localnet_reader = None
+
+    async def read_localnet_output(self):
+        """Read localnet output, surfacing important lines and signalling readiness"""
+        try:
+            while True:
+                try:
+                    raw_line = await self.localnet_process.stdout.readline()
+                except ValueError:
+                    # Line longer than STREAM_LIMIT; readline already dropped it, keep draining
+                    self.log("[localnet] Skipped an oversized output line", "DEBUG")
+                    continue
+                if not raw_line:
+                    break
+
+                line = raw_line.decode('utf-8', 'replace').strip()
+                self.localnet_tail.append(line)
+                # Show important messages
+                if LOCALNET_KW_RE.search(line):
+                    self.log(f"[localnet] {line}", "DEBUG")
+                # Signal readiness once the node reports it is listening
+                if LISTENING_RE.search(line):
+                    self.localnet_ready.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.log(f"Output monitor error: {e}", "DEBUG")
+
+    def log_localnet_tail(self, header, count):
+        """Log the last lines of localnet output for diagnosis"""
+        self.log(header, "ERROR")
+        for line in list(self.localnet_tail)[-count:]:
+            self.log(f"  {line}", "ERROR")
+
+    async def start_localnet(self):
         """Start localnet in background and verify both ports"""
         self.log("Starting localnet...")
 
         # Kill any existing processes on required ports
-        self.kill_process_on_port(9000)
-        self.kill_process_on_port(9123)
-        time.sleep(2)
+        self.kill_processes_on_ports({9000, 9123})
+        await asyncio.sleep(2)
 
-        # Start localnet in background using subprocess
+        # Start localnet in background with a single reader task draining its output
+        self.localnet_ready = asyncio.Event()
+        self.localnet_tail = collections.deque(maxlen=30)
         try:
             cmd = [
                 str(self.sui_binary), "start",
@@ -183,89 +255,55 @@ class IntegrationTester:
             env = os.environ.copy()
             env["RUST_LOG"] = "off,sui_node=info"
 
-            # Use subprocess.Popen for better control
-            self.localnet_process = subprocess.Popen(
-                cmd,
+            self.localnet_process = await asyncio.create_subprocess_exec(
+                *cmd,
                 cwd=str(self.script_dir),
                 env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                text=True,
-                bufsize=1  # Line buffered
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,  # Combine stderr with stdout
+                limit=STREAM_LIMIT
             )
+            self.localnet_reader = asyncio.create_task(self.read_localnet_output())
 
             # Wait a moment to check if process started successfully
             self.log("Checking if localnet process started...")
-            time.sleep(2)
+            await asyncio.sleep(2)
 
             # Check if process is still running
-            poll_result = self.localnet_process.poll()
-            if poll_result is not None:
-                # Process died, capture output
-                self.log(f"Localnet process exited early with code: {poll_result}", "ERROR")
-                try:
-                    output, _ = self.localnet_process.communicate(timeout=1)
-                    self.log("Localnet startup output:", "ERROR")
-                    for line in output.splitlines()[-20:]:  # Last 20 lines
-                        self.log(f"  {line}", "ERROR")
-                except subprocess.TimeoutExpired:
-                    self.log("Could not capture process output", "WARNING")
-
-                self.cleanup_localnet_process()
+            if self.localnet_process.returncode is not None:
+                self.log(f"Localnet process exited early with code: {self.localnet_process.returncode}", "ERROR")
+                await asyncio.wait([self.localnet_reader], timeout=1)
+                self.log_localnet_tail("Localnet startup output:", 20)
+                await self.cleanup_localnet_process()
                 return False
 
-            # Process is running, continue with longer wait
-            self.log("Localnet process started successfully, waiting 6 seconds for initialization...")
-
-            # Start output monitoring thread
-            def monitor_localnet_output():
-                """Monitor localnet output in background"""
-                try:
-                    while self.localnet_process and self.localnet_process.poll() is None:
-                        line = self.localnet_process.stdout.readline()
-                        if line:
-                            line = line.strip()
-                            # Show important messages
-                            if any(keyword in line.lower() for keyword in ['error', 'fatal', 'panic', 'failed', 'listening']):
-                                self.log(f"[localnet] {line}", "DEBUG")
-                        else:
-                            break
-                except Exception as e:
-                    self.log(f"Output monitor error: {e}", "DEBUG")
-
-            # Start monitoring thread
-            monitor_thread = threading.Thread(target=monitor_localnet_output, daemon=True)
-            monitor_thread.start()
-
-            time.sleep(6)
+            # Process is running, wait for it to report it is listening
+            self.log("Localnet process started successfully, waiting for it to start listening...")
+            try:
+                await asyncio.wait_for(self.localnet_ready.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                self.log("No listening message from localnet yet, probing ports anyway", "DEBUG")
 
             # Check both RPC (9000) and faucet (9123) ports with extended timeout
             self.log("Checking if ports 9000 and 9123 are available...")
 
             # Check if process is still alive before checking ports
-            poll_result = self.localnet_process.poll()
-            if poll_result is not None:
-                self.log(f"Localnet process died during startup with code: {poll_result}", "ERROR")
-                try:
-                    output, _ = self.localnet_process.communicate(timeout=2)
-                    self.log("Localnet process output:", "ERROR")
-                    for line in output.splitlines()[-30:]:  # Last 30 lines
-                        self.log(f"  {line}", "ERROR")
-                except subprocess.TimeoutExpired:
-                    self.log("Could not capture process output", "WARNING")
-                except Exception:
-                    pass
-                self.cleanup_localnet_process()
+            if self.localnet_process.returncode is not None:
+                self.log(f"Localnet process died during startup with code: {self.localnet_process.returncode}", "ERROR")
+                await asyncio.wait([self.localnet_reader], timeout=2)
+                self.log_localnet_tail("Localnet process output:", 30)
+                await self.cleanup_localnet_process()
                 return False
 
-            # Check ports with better error handling
+            # Check ports concurrently so the total wait is the slower of the two
             try:
-                port_9000_open = self.is_port_open(9000, timeout=30)
-                port_9123_open = self.is_port_open(9123, timeout=15)
+                port_9000_open, port_9123_open = await asyncio.gather(
+                    asyncio.to_thread(self.is_port_open, 9000, 30),
+                    asyncio.to_thread(self.is_port_open, 9123, 15)
+                )
 
                 if port_9000_open and port_9123_open:
                     self.log("Localnet started successfully", "SUCCESS")
-                    time.sleep(3)  # Extra stability wait
                     return True
                 else:
                     self.log("Ports not available after waiting:", "ERROR")
@@ -273,54 +311,45 @@ class IntegrationTester:
                     self.log(f"  Port 9123 (Faucet): {'OPEN' if port_9123_open else 'CLOSED'}", "ERROR")
 
                     # Check if process is still alive
-                    if self.localnet_process.poll() is None:
+                    if self.localnet_process.returncode is None:
                         self.log("Process is still running but ports are not open", "ERROR")
-                        # Try to get some output for diagnosis
-                        try:
-                            # Give process a moment to produce output
-                            time.sleep(1)
-                            # Non-blocking read attempt
-                            import select
-                            if hasattr(select, 'select'):
-                                ready, _, _ = select.select([self.localnet_process.stdout], [], [], 0)
-                                if ready:
-                                    line = self.localnet_process.stdout.readline()
-                                    if line:
-                                        self.log(f"Recent output: {line.strip()}", "DEBUG")
-                        except Exception:
-                            pass
+                        if self.localnet_tail:
+                            self.log(f"Recent output: {self.localnet_tail[-1]}", "DEBUG")
                     else:
                         self.log("Process has died", "ERROR")
 
-                    self.cleanup_localnet_process()
+                    await self.cleanup_localnet_process()
                     return False
 
             except Exception as port_error:
                 self.log(f"Error during port checking: {port_error}", "ERROR")
-                self.cleanup_localnet_process()
+                await self.cleanup_localnet_process()
                 return False
 
         except Exception as e:
             self.log(f"Failed to start localnet: {e}", "ERROR")
-            self.cleanup_localnet_process()
+            await self.cleanup_localnet_process()
             return False
 
     def get_active_address(self):
-        """Get current active address"""
+        """Get current active address, cached after the first lookup"""
+        if self._active_address:
+            return self._active_address
         try:
             result = self.run_sui_command("client", "active-address")
             address = result.stdout.strip()
             self.log(f"Active address: {address}", "DEBUG")
+            self._active_address = address
             return address
         except Exception as e:
             self.log(f"Failed to get active address: {e}", "ERROR")
             return None
 
     def request_faucet_via_http(self, address):
-        """Request faucet via HTTP API"""
+        """Request faucet via HTTP API, returning (success, number of coins sent)"""
         try:
             self.log("Requesting faucet via HTTP API...")
-            response = requests.post(
+            response = self.http.post(
                 "http://localhost:9123/gas",
                 json={"FixedAmountRequest": {"recipient": address}},
                 timeout=10
@@ -330,27 +359,31 @@ class IntegrationTester:
                 data = response.json()
                 success = data.get("status") == "Success"
                 if success:
-                    coins_count = len(data.get("coins_sent", []))
+                    coins_count = len(data.get("coins_sent") or [])
                     self.log(f"Faucet HTTP request successful: {coins_count} coins sent", "SUCCESS")
-                else:
-                    self.log(f"Faucet HTTP request failed: {data}", "ERROR")
-                return success
+                    return True, coins_count
+                self.log(f"Faucet HTTP request failed: {data}", "ERROR")
+                return False, 0
             else:
                 self.log(f"Faucet HTTP request failed: {response.status_code} {response.text}", "ERROR")
-                return False
+                return False, 0
 
         except Exception as e:
             self.log(f"Faucet HTTP request error: {e}", "ERROR")
-            return False
+            return False, 0
 
     def setup_wallet(self):
         """Setup wallet with improved faucet handling"""
         self.log("Setting up wallet...")
 
         try:
+            # These client commands stay sequential: the sui CLI has no way to
+            # fuse them, and each one reads and rewrites the shared client
+            # config and keystore, so overlapping them can lose updates.
+
             # Try to create new address (ignore failure if alias exists)
             try:
-                self.run_sui_command("client", "new-address", "ed25519", "move-fuzzer")
+                self.run_sui_command("client", "new-address", "ed25519", "move-fuzzer", capture=False)
             except Exception:
                 pass  # Ignore if alias already exists
 
@@ -359,7 +392,7 @@ class IntegrationTester:
 
             # Try to create new env (ignore failure if alias exists)
             try:
-                self.run_sui_command("client", "new-env", "--alias", "local", "--rpc", "http://127.0.0.1:9000")
+                self.run_sui_command("client", "new-env", "--alias", "local", "--rpc", "http://127.0.0.1:9000", capture=False)
             except Exception:
                 pass  # Ignore if alias already exists
 
@@ -371,17 +404,16 @@ class IntegrationTester:
             if not address:
                 return False
 
-            # Try standard faucet command first
-            faucet_success = False
-            try:
-                self.log("Trying standard faucet command...")
-                result = self.run_sui_command("client", "faucet")
-                self.log(f"Faucet command output: {result.stdout}", "DEBUG")
-                faucet_success = True
-            except Exception as e:
-                self.log(f"Standard faucet failed: {e}", "WARNING")
-                # Try HTTP API as fallback
-                faucet_success = self.request_faucet_via_http(address)
+            # Try HTTP faucet first; a success listing the coins sent needs no gas check
+            faucet_success, coins_count = self.request_faucet_via_http(address)
+            if not faucet_success:
+                try:
+                    self.log("Trying standard faucet command...")
+                    result = self.run_sui_command("client", "faucet")
+                    self.log(f"Faucet command output: {result.stdout}", "DEBUG")
+                    faucet_success = True
+                except Exception as e:
+                    self.log(f"Standard faucet failed: {e}", "WARNING")
 
             if not faucet_success:
                 self.log("Both faucet methods failed", "ERROR")
@@ -390,7 +422,11 @@ class IntegrationTester:
             # Wait for processing
             time.sleep(3)
 
-            # Verify gas is available
+            if coins_count:
+                self.log("Wallet setup completed successfully", "SUCCESS")
+                return True
+
+            # Faucet response did not confirm any coins, so verify gas is available
             try:
                 gas_result = self.run_sui_command("client", "gas")
                 gas_output = gas_result.stdout.strip()
@@ -423,20 +459,18 @@ class IntegrationTester:
             self.log("Contract built successfully", "SUCCESS")
 
             # Deploy contract
-            result = self.run_sui_command("client", "publish", "--gas-budget", "100000000", cwd=contract_dir)
+            result = self.run_sui_command("client", "publish", "--gas-budget", "100000000", cwd=contract_dir, text=False)
             output = result.stdout
 
-            # Extract package ID
-            import re
-            # Match "PackageID: 0x..." format from publish output
-            package_pattern = r"PackageID:\s*(0x[a-fA-F0-9]+)"
-            match = re.search(package_pattern, output, re.IGNORECASE)
+            # Extract package ID from "PackageID: 0x..." in publish output
+            match = PKG_RE.search(output)
             if match:
-                self.package_id = match.group(1)
+                self.package_id = match.group(1).decode('ascii')
                 self.log(f"Contract deployed successfully: {self.package_id}", "SUCCESS")
                 return True
             else:
                 self.log("Failed to extract package ID from deployment output", "ERROR")
+                output = output.decode('utf-8', 'replace')
                 self.log("Output snippet (first 500 chars):", "DEBUG")
                 self.log(output[:500], "DEBUG")
                 self.log("Full output:", "DEBUG")
@@ -465,20 +499,15 @@ class IntegrationTester:
             self.log("Create shared demo struct output:", "DEBUG")
             self.log(result.stdout, "DEBUG")
 
-            # Extract object ID from Created Objects section
-            import re
-
             # Find the Created Objects section and get the first ObjectID after it
-            created_pattern = r"Created Objects:.*?ObjectID:\s*(0x[a-fA-F0-9]+)"
-            match = re.search(created_pattern, result.stdout, re.DOTALL | re.IGNORECASE)
+            match = CREATED_RE.search(result.stdout)
 
             if match:
                 self.shared_object_id = match.group(1)
                 self.log(f"Extracted shared object ID: {self.shared_object_id}", "DEBUG")
             else:
                 # Fallback: try simpler pattern and take first match
-                fallback_pattern = r"│\s*ObjectID:\s*(0x[a-fA-F0-9]+)"
-                matches = re.findall(fallback_pattern, result.stdout, re.IGNORECASE)
+                matches = OBJECT_ID_RE.findall(result.stdout)
                 if matches:
                     self.shared_object_id = matches[0]  # Take first match
                     self.log(f"Extracted shared object ID (fallback): {self.shared_object_id}", "DEBUG")
@@ -494,7 +523,21 @@ class IntegrationTester:
             self.log(f"Failed to create test objects: {e}", "ERROR")
             return False
 
-    def run_fuzzer_test(self, test_case):
+    async def stop_process(self, process):
+        """Terminate a subprocess if it is still running, killing it if it does not exit"""
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            pass  # Already exited
+
+    async def run_fuzzer_test(self, test_case):
         """Run a single fuzzer test case"""
         name = test_case["name"]
         function = test_case["function"]
@@ -507,11 +550,12 @@ class IntegrationTester:
             args = self.shared_object_id
 
         self.log(f"Running test: {name} ({iterations:,} iterations)")
-        start_time = time.time()
+        start_time = time.monotonic()
+        process = None
 
         try:
             # Build fuzzer command arguments
-            fuzzer_cmd = ["cargo", "run", "-p", "fuzzer", "--release", "--", "sui"]
+            fuzzer_cmd = [str(self.fuzzer_bin), "sui"]
             fuzzer_args = [
                 "--rpc-url", "http://localhost:9000",
                 "--package", self.package_id,
@@ -548,72 +592,76 @@ class IntegrationTester:
             # Run with real-time output monitoring
             self.log(f"Starting fuzzer with command: {' '.join(full_cmd)}", "DEBUG")
 
-            process = subprocess.Popen(
-                full_cmd,
+            process = await asyncio.create_subprocess_exec(
+                *full_cmd,
                 cwd=self.root_dir,
                 env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1  # Line buffered
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=STREAM_LIMIT
             )
 
-            output_lines = []
             violations_found = False
+            deadline = start_time + timeout
 
             try:
-                # Monitor output in real-time
+                # Monitor output in real-time, enforcing the deadline on every read
                 while True:
-                    line = process.stdout.readline()
-                    if not line:
+                    try:
+                        raw_line = await asyncio.wait_for(process.stdout.readline(), timeout=deadline - time.monotonic())
+                    except ValueError:
+                        # Line longer than STREAM_LIMIT; readline already dropped it
+                        self.log(f"[fuzzer:{name}] Skipped an oversized output line", "DEBUG")
+                        continue
+                    if not raw_line:
                         break
 
-                    line = line.strip()
-                    if line:
-                        output_lines.append(line)
+                    # Skip routine lines on the raw bytes; every check below
+                    # needs one of these keywords, so only matches are decoded
+                    if not FUZZER_KW_RE.search(raw_line):
+                        continue
 
-                        # Show important lines
-                        if any(keyword in line.lower() for keyword in
-                               ['iteration', 'shift', 'violation', 'detected', 'error', 'failed']):
-                            self.log(f"[fuzzer] {line}", "DEBUG")
+                    # Show important lines
+                    line = raw_line.decode('utf-8', 'replace').strip()
+                    self.log(f"[fuzzer:{name}] {line}", "DEBUG")
 
-                        # Always show progress every 10000 iterations
-                        if "iteration" in line.lower() and ("10000" in line or "000000" in line):
-                            self.log(f"[fuzzer] {line}", "INFO")
+                    # Always show progress every 10000 iterations
+                    if ITERATION_RE.search(line) and ("10000" in line or "000000" in line):
+                        self.log(f"[fuzzer:{name}] {line}", "INFO")
 
-                        # Check for violations
-                        if "SHIFT VIOLATION DETECTED" in line.upper():
-                            violations_found = True
-                            self.log(f"[fuzzer] VIOLATION FOUND: {line}", "SUCCESS")
+                    # Check for violations
+                    if VIOLATION_RE.search(line):
+                        violations_found = True
+                        self.log(f"[fuzzer:{name}] VIOLATION FOUND: {line}", "SUCCESS")
 
                 # Wait for process completion
-                return_code = process.wait(timeout=timeout)
-                end_time = time.time()
+                return_code = await asyncio.wait_for(process.wait(), timeout=deadline - time.monotonic())
+                end_time = time.monotonic()
                 execution_time = end_time - start_time
 
                 success = (return_code == 0) or violations_found  # Success if clean exit or violation found
 
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 self.log(f"Test {name} timed out after {timeout}s, terminating...", "WARNING")
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
+                await self.stop_process(process)
 
-                end_time = time.time()
+                end_time = time.monotonic()
                 execution_time = end_time - start_time
                 success = False
                 violations_found = False
 
         except Exception as e:
-            end_time = time.time()
+            end_time = time.monotonic()
             execution_time = end_time - start_time
             success = False
             violations_found = False
             self.log(f"Test {name} failed: {e}", "ERROR")
 
+        finally:
+            # Never leave the fuzzer running, whether we failed or were cancelled
+            if process is not None:
+                await self.stop_process(process)
+
         # Record result
         test_result = {
             "name": name,
@@ -638,13 +686,33 @@ class IntegrationTester:
 
         return success
 
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all test cases"""
         self.log("Running fuzzer tests...")
 
+        # Tests on the shared object mutate common state, so they run one at a time
+        shared_tests = []
+        independent_tests = []
         for test_case in self.config["test_cases"]:
-            self.run_fuzzer_test(test_case)
-            time.sleep(1)  # Brief pause between tests
+            if test_case["function"] == "mutable_shared_struct_shl":
+                shared_tests.append(test_case)
+            else:
+                independent_tests.append(test_case)
+
+        semaphore = asyncio.Semaphore(min(4, os.cpu_count() or 1))
+
+        async def run_guarded(test_case):
+            async with semaphore:
+                return await self.run_fuzzer_test(test_case)
+
+        await asyncio.gather(*(run_guarded(test_case) for test_case in independent_tests))
+
+        for test_case in shared_tests:
+            await self.run_fuzzer_test(test_case)
+
+        # Concurrent tests finish in any order; report them in config order
+        order = {test_case["name"]: index for index, test_case in enumerate(self.config["test_cases"])}
+        self.test_results.sort(key=lambda result: order[result["name"]])
 
         return True
 
@@ -677,36 +745,32 @@ class IntegrationTester:
         console.print()
         console.print(table)
 
-        # Generate Markdown report using Jinja2
-        report_template = Template("""## SUI Fuzzer Integration Test Report
-
-**Generated**: {{ timestamp }}
-**Package ID**: {{ package_id }}
-**Overall Result**: {{ "PASSED" if all_passed else "FAILED" }}
-
-### Test Results
-
-| Test | Passed | Time |
-|------|--------|------|
-{%- for result in results %}
-| {{ result.name }} | {{ "✓" if result.passed else "✗" }} | {{ "%.1f"|format(result.execution_time) }}s |
-{%- endfor %}
-""")
-
-        # Prepare template data
+        # Prepare report rows
         results_with_passed = []
         for result in self.test_results:
             result_copy = result.copy()
             result_copy['passed'] = result['success'] and (result['expected_violations'] == result['violations_found'])
             results_with_passed.append(result_copy)
 
-        report_content = report_template.render(
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            package_id=self.package_id,
-            all_passed=all_passed,
-            results=results_with_passed
+        rows = "\n".join(
+            f"| {r['name']} | {'✓' if r['passed'] else '✗'} | {r['execution_time']:.1f}s |"
+            for r in results_with_passed
         )
 
+        # Generate Markdown report
+        report_content = f"""## SUI Fuzzer Integration Test Report
+
+**Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Package ID**: {self.package_id}
+**Overall Result**: {"PASSED" if all_passed else "FAILED"}
+
+### Test Results
+
+| Test | Passed | Time |
+|------|--------|------|
+{rows}
+"""
+
         # Write report file
         report_file = self.root_dir / "test-report.md"
         with open(report_file, 'w') as f:
@@ -721,16 +785,17 @@ class IntegrationTester:
             self.log("Some tests FAILED ❌", "ERROR")
             return False
 
-    def cleanup(self):
+    async def cleanup(self):
         """Clean up background processes"""
         # Use the improved cleanup function
-        self.cleanup_localnet_process()
+        await self.cleanup_localnet_process()
 
         # Kill any remaining processes on required ports
-        self.kill_process_on_port(9000)
-        self.kill_process_on_port(9123)
+        self.kill_processes_on_ports({9000, 9123})
 
-    def run(self):
+        self.http.close()
+
+    async def run(self):
         """Run the complete integration test"""
         try:
             rprint("[bold blue]🚀 Starting Move Fuzzer Integration Tests[/bold blue]")
@@ -738,47 +803,45 @@ class IntegrationTester:
             if not self.build_fuzzer():
                 return False
 
-            if not self.start_localnet():
+            if not await self.start_localnet():
                 # Ensure cleanup on localnet startup failure
-                self.cleanup_localnet_process()
+                await self.cleanup_localnet_process()
                 return False
 
-            if not self.setup_wallet():
+            # Blocking steps run off the event loop so the localnet reader keeps draining output
+            if not await asyncio.to_thread(self.setup_wallet):
                 return False
 
-            if not self.deploy_contract():
+            if not await asyncio.to_thread(self.deploy_contract):
                 return False
 
-            if not self.create_test_objects():
+            if not await asyncio.to_thread(self.create_test_objects):
                 return False
 
-            if not self.run_all_tests():
+            if not await self.run_all_tests():
                 return False
 
             return self.generate_report()
 
-        except KeyboardInterrupt:
+        except asyncio.CancelledError:
             self.log("Tests interrupted by user", "WARNING")
-            return False
+            raise
         except Exception as e:
             self.log(f"Unexpected error: {e}", "ERROR")
             return False
         finally:
-            self.cleanup()
+            await self.cleanup()
 
 def main():
     tester = IntegrationTester()
 
-    # Handle Ctrl+C gracefully
-    def signal_handler(_, __):
-        tester.cleanup()
-        sys.exit(1)
-
-    signal.signal(signal.SIGINT, signal_handler)
-
-    # Run tests
-    success = tester.run()
+    # Run tests; Ctrl+C cancels the run, which cleans up before exiting
+    try:
+        success = asyncio.run(tester.run())
+    except KeyboardInterrupt:
+        tester.kill_processes_on_ports({9000, 9123})
+        success = False
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()